@@ -1,6 +1,17 @@
 from abc import ABC, abstractmethod
 
+TAX_RATE = 0.18
+
+def _summary(invoice):
+    total = invoice.amount + (invoice.amount * TAX_RATE)
+    return f"Amount: {invoice.amount}, Tax: {TAX_RATE:.0%}, Total: {total}"
+
+def _sql_rows(invoices):
+    return ", ".join(f"('{invoice.customer_name}', {invoice.amount})" for invoice in invoices)
+
 class Invoice:
+    __slots__ = ("customer_name", "amount")
+
     def __init__(self, customer_name, amount):
         self.customer_name = customer_name
         self.amount = amount
@@ -10,33 +21,72 @@ class InvoiceRepository(ABC):
     def save(self, invoice: Invoice):
         pass
 
+    def save_many(self, invoices: list):
+        for invoice in invoices:
+            self.save(invoice)
+
 class NotificationService(ABC):
     @abstractmethod
     def notify(self, invoice: Invoice):
         pass
 
+    def notify_many(self, invoices: list):
+        for invoice in invoices:
+            self.notify(invoice)
+
 class MySQLRepository(InvoiceRepository):
     def save(self, invoice: Invoice):
         print(f"[MySQL] Saving invoice for {invoice.customer_name} to MySQL database")
         print(f"[MySQL] INSERT INTO invoices VALUES ('{invoice.customer_name}', {invoice.amount})")
 
+    def save_many(self, invoices: list):
+        if not invoices:
+            return
+        rows = _sql_rows(invoices)
+        print(f"[MySQL] Saving {len(invoices)} invoices to MySQL database")
+        print(f"[MySQL] INSERT INTO invoices VALUES {rows}")
+
 class MongoDBRepository(InvoiceRepository):
     def save(self, invoice: Invoice):
         print(f"[MongoDB] Saving invoice for {invoice.customer_name} to MongoDB")
         print(f"[MongoDB] db.invoices.insert({{customer: '{invoice.customer_name}', amount: {invoice.amount}}})")
 
+    def save_many(self, invoices: list):
+        if not invoices:
+            return
+        documents = ", ".join(
+            f"{{customer: '{invoice.customer_name}', amount: {invoice.amount}}}" for invoice in invoices
+        )
+        print(f"[MongoDB] Saving {len(invoices)} invoices to MongoDB")
+        print(f"[MongoDB] db.invoices.insertMany([{documents}])")
+
 
 class PostgreSQLRepository(InvoiceRepository):
     def save(self, invoice: Invoice):
         print(f"[PostgreSQL] Saving invoice for {invoice.customer_name} to PostgreSQL")
         print(f"[PostgreSQL] INSERT INTO invoices VALUES ('{invoice.customer_name}', {invoice.amount})")
 
+    def save_many(self, invoices: list):
+        if not invoices:
+            return
+        rows = _sql_rows(invoices)
+        print(f"[PostgreSQL] Saving {len(invoices)} invoices to PostgreSQL")
+        print(f"[PostgreSQL] INSERT INTO invoices VALUES {rows}")
+
 
 class EmailNotificationService(NotificationService):
     def notify(self, invoice: Invoice):
         print(f"[Email] Sending invoice email to {invoice.customer_name}")
         print(f"[Email] Subject: Invoice for ${invoice.amount}")
 
+    def notify_many(self, invoices: list):
+        if not invoices:
+            return
+        recipients = ", ".join(invoice.customer_name for invoice in invoices)
+        amounts = ", ".join(f"{invoice.customer_name} (${invoice.amount})" for invoice in invoices)
+        print(f"[Email] Sending batch invoice email to {recipients}")
+        print(f"[Email] Subject: Invoices for {amounts}")
+
 
 class SMSNotificationService(NotificationService):
     def notify(self, invoice: Invoice):
@@ -51,19 +101,29 @@ class SlackNotificationService(NotificationService):
 
 
 class InvoiceProcessor:
+    __slots__ = ("repository", "notification")
+
     def __init__(self, repository: InvoiceRepository, notification: NotificationService):
         self.repository = repository
         self.notification = notification
 
     def process_invoice(self, invoice: Invoice):
-        tax = 0.18
-        total = invoice.amount + (invoice.amount * tax)
         print(f"\n[Processor] Processing invoice for {invoice.customer_name}")
-        print(f"[Processor] Amount: {invoice.amount}, Tax: 18%, Total: {total}")
+        print(f"[Processor] {_summary(invoice)}")
 
         self.repository.save(invoice)
         self.notification.notify(invoice)
 
+    def process_invoices(self, invoices: list):
+        if not invoices:
+            return
+        print(f"\n[Processor] Processing batch of {len(invoices)} invoices")
+        for invoice in invoices:
+            print(f"[Processor] {invoice.customer_name} - {_summary(invoice)}")
+
+        self.repository.save_many(invoices)
+        self.notification.notify_many(invoices)
+
 
 invoice1 = Invoice("Nirbhay", 1000)
 invoice2 = Invoice("Rahul", 2000)
@@ -96,3 +156,17 @@ processor4 = InvoiceProcessor(
     notification=EmailNotificationService()
 )
 processor4.process_invoice(invoice1)
+
+print("\n=== Scenario 5: Batch - PostgreSQL + SMS ===")
+processor5 = InvoiceProcessor(
+    repository=PostgreSQLRepository(),
+    notification=SMSNotificationService()
+)
+processor5.process_invoices([invoice1, invoice2, invoice3])
+
+print("\n=== Scenario 6: Batch - MySQL + Email ===")
+processor6 = InvoiceProcessor(
+    repository=MySQLRepository(),
+    notification=EmailNotificationService()
+)
+processor6.process_invoices([invoice1, invoice2, invoice3])
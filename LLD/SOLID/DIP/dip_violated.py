@@ -1,4 +1,9 @@
+TAX_RATE = 0.18
+
+
 class Invoice:
+    __slots__ = ("customer_name", "amount")
+
     def __init__(self, customer_name, amount):
         self.customer_name = customer_name
         self.amount = amount
@@ -17,15 +22,16 @@ class EmailService:
 
 
 class InvoiceProcessor:
+    __slots__ = ("database", "email_service")
+
     def __init__(self):
         self.database = MySQLDatabase()
         self.email_service = EmailService()
 
     def process_invoice(self, invoice: Invoice):
-        tax = 0.18
-        total = invoice.amount + (invoice.amount * tax)
+        total = invoice.amount + (invoice.amount * TAX_RATE)
         print(f"\n[Processor] Processing invoice for {invoice.customer_name}")
-        print(f"[Processor] Amount: {invoice.amount}, Tax: 18%, Total: {total}")
+        print(f"[Processor] Amount: {invoice.amount}, Tax: {TAX_RATE:.0%}, Total: {total}")
 
         self.database.save_invoice(invoice)
         self.email_service.send_invoice_email(invoice)
@@ -1,11 +1,21 @@
 from abc import ABC, abstractmethod
 
+TAX_RATE = 0.18
+
 class Invoice:
+    __slots__ = ("customer_name", "amount")
+
     def __init__(self, customer_name, amount):
         self.customer_name = customer_name
         self.amount = amount
 
 
+def _calculate_total(invoice: Invoice, label: str) -> float:
+    total = invoice.amount + (invoice.amount * TAX_RATE)
+    print(f"[{label}] Calculated total: {total}")
+    return total
+
+
 class InvoiceCalculator(ABC):
     @abstractmethod
     def calculate_total(self, invoice: Invoice) -> float:
@@ -44,10 +54,7 @@ class FullInvoiceService(
     InvoiceSMSNotification
 ):
     def calculate_total(self, invoice: Invoice) -> float:
-        tax = 0.18
-        total = invoice.amount + (invoice.amount * tax)
-        print(f"[Full Service] Calculated total: {total}")
-        return total
+        return _calculate_total(invoice, "Full Service")
 
     def save_to_database(self, invoice: Invoice):
         print(f"[Full Service] Saved invoice for {invoice.customer_name} to database")
@@ -64,10 +71,7 @@ class FullInvoiceService(
 
 class ReadOnlyInvoiceService(InvoiceCalculator):
     def calculate_total(self, invoice: Invoice) -> float:
-        tax = 0.18
-        total = invoice.amount + (invoice.amount * tax)
-        print(f"[ReadOnly] Calculated total: {total}")
-        return total
+        return _calculate_total(invoice, "ReadOnly")
 
 
 class EmailOnlyInvoiceService(InvoiceEmailNotification):
@@ -91,10 +95,7 @@ class InvoiceReportService(
     InvoicePDFGenerator
 ):
     def calculate_total(self, invoice: Invoice) -> float:
-        tax = 0.18
-        total = invoice.amount + (invoice.amount * tax)
-        print(f"[Report] Calculated total: {total}")
-        return total
+        return _calculate_total(invoice, "Report")
 
     def generate_pdf(self, invoice: Invoice):
         print(f"[Report] PDF generated for {invoice.customer_name}")
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
 
+TAX_RATE = 0.18
+
 
 class Invoice:
+    __slots__ = ("customer_name", "amount")
+
     def __init__(self, customer_name, amount):
         self.customer_name = customer_name
         self.amount = amount
@@ -31,8 +35,7 @@ class InvoiceOperations(ABC):
 
 class FullInvoiceService(InvoiceOperations):
     def calculate_total(self, invoice: Invoice) -> float:
-        tax = 0.18
-        total = invoice.amount + (invoice.amount * tax)
+        total = invoice.amount + (invoice.amount * TAX_RATE)
         print(f"[Full Service] Calculated total: {total}")
         return total
 
@@ -51,8 +54,7 @@ class FullInvoiceService(InvoiceOperations):
 
 class ReadOnlyInvoiceService(InvoiceOperations):
     def calculate_total(self, invoice: Invoice) -> float:
-        tax = 0.18
-        total = invoice.amount + (invoice.amount * tax)
+        total = invoice.amount + (invoice.amount * TAX_RATE)
         print(f"[ReadOnly] Calculated total: {total}")
         return total
 
@@ -1,4 +1,11 @@
+import math
+
+TAX_RATE = 0.18
+
+
 class Invoice:
+    __slots__ = ("customer_name", "amount", "is_locked")
+
     def __init__(self, customer_name, amount, is_locked=False):
         self.customer_name = customer_name
         self.amount = amount
@@ -13,10 +20,9 @@ class InvoiceProcessor:
         if not self.can_process(invoice):
             return 0.0
         
-        tax = 0.18
-        total = invoice.amount + (invoice.amount * tax)
+        total = invoice.amount + (invoice.amount * TAX_RATE)
         print(f"Processing invoice for {invoice.customer_name}")
-        print(f"Amount: {invoice.amount}, Tax: 18%, Total: {total}")
+        print(f"Amount: {invoice.amount}, Tax: {TAX_RATE:.0%}, Total: {total}")
         return total
 
 
@@ -29,10 +35,9 @@ class RegularInvoiceProcessor(InvoiceProcessor):
             print(f"[Regular] Invoice for {invoice.customer_name} is locked, skipping")
             return 0.0
         
-        tax = 0.18
-        total = invoice.amount + (invoice.amount * tax)
+        total = invoice.amount + (invoice.amount * TAX_RATE)
         print(f"[Regular] Processing invoice for {invoice.customer_name}")
-        print(f"Amount: {invoice.amount}, Tax: 18%, Total: {total}")
+        print(f"Amount: {invoice.amount}, Tax: {TAX_RATE:.0%}, Total: {total}")
         return total
 
 
@@ -59,20 +64,17 @@ class ZeroAmountInvoiceProcessor(InvoiceProcessor):
             print(f"[Zero Amount] Invoice for {invoice.customer_name} has zero amount")
             return 0.0
         
-        tax = 0.18
-        total = invoice.amount + (invoice.amount * tax)
+        total = invoice.amount + (invoice.amount * TAX_RATE)
         print(f"[Zero Amount] Processing invoice for {invoice.customer_name}")
-        print(f"Amount: {invoice.amount}, Tax: 18%, Total: {total}")
+        print(f"Amount: {invoice.amount}, Tax: {TAX_RATE:.0%}, Total: {total}")
         return total
 
 
 def generate_report(processor: InvoiceProcessor, invoices: list):
     print("\n=== Generating Report ===")
-    total_revenue = 0.0
-    
-    for invoice in invoices:
-        total = processor.process(invoice)
-        total_revenue += total
+    process = processor.process
+    totals = [process(invoice) for invoice in invoices]
+    total_revenue = math.fsum(totals)
     
     print(f"Total Revenue: {total_revenue}")
     return total_revenue
@@ -1,4 +1,9 @@
+TAX_RATE = 0.18
+
+
 class Invoice:
+    __slots__ = ("customer_name", "amount")
+
     def __init__(self, customer_name, amount):
         self.customer_name = customer_name
         self.amount = amount
@@ -9,10 +14,9 @@ class InvoiceProcessor:
     
     def process(self, invoice: Invoice):
         """Process the invoice and return total"""
-        tax = 0.18
-        total = invoice.amount + (invoice.amount * tax)
+        total = invoice.amount + (invoice.amount * TAX_RATE)
         print(f"Processing invoice for {invoice.customer_name}")
-        print(f"Amount: {invoice.amount}, Tax: 18%, Total: {total}")
+        print(f"Amount: {invoice.amount}, Tax: {TAX_RATE:.0%}, Total: {total}")
         return total
 
 
@@ -20,10 +24,9 @@ class RegularInvoiceProcessor(InvoiceProcessor):
     """Handles regular invoices - works fine"""
     
     def process(self, invoice: Invoice):
-        tax = 0.18
-        total = invoice.amount + (invoice.amount * tax)
+        total = invoice.amount + (invoice.amount * TAX_RATE)
         print(f"[Regular] Processing invoice for {invoice.customer_name}")
-        print(f"Amount: {invoice.amount}, Tax: 18%, Total: {total}")
+        print(f"Amount: {invoice.amount}, Tax: {TAX_RATE:.0%}, Total: {total}")
         return total
 
 
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 
 class Invoice:
+    __slots__ = ("customer_name", "amount")
+
     def __init__(self, customer_name, amount):
         self.customer_name = customer_name
         self.amount = amount
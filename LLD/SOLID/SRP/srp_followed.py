@@ -1,4 +1,9 @@
+TAX_RATE = 0.18
+
+
 class Invoice:
+    __slots__ = ("customer_name", "amount")
+
     def __init__(self, customer_name, amount):
         self.customer_name = customer_name
         self.amount = amount
@@ -6,8 +11,7 @@ class Invoice:
 
 class InvoiceCalculator:
     def calculate_total(self, invoice: Invoice):
-        tax = 0.18
-        total = invoice.amount + (invoice.amount * tax)
+        total = invoice.amount + (invoice.amount * TAX_RATE)
         print(f"Calculated total with tax: {total}")
 
 
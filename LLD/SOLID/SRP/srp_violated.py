@@ -1,11 +1,15 @@
+TAX_RATE = 0.18
+
+
 class Invoice:
+    __slots__ = ("customer_name", "amount")
+
     def __init__(self, customer_name, amount):
         self.customer_name = customer_name
         self.amount = amount
 
     def calculate_total(self):
-        tax = 0.18
-        total = self.amount + (self.amount * tax)
+        total = self.amount + (self.amount * TAX_RATE)
         print(f"Calculated total with tax: {total}")
         return total
 
@@ -1,3 +1,4 @@
+import functools
 from abc import ABC, abstractmethod
 from enum import Enum
 
@@ -8,6 +9,8 @@ class SupportTicket:
     SEVERITY_HIGH = "HIGH"
     SEVERITY_CRITICAL = "CRITICAL"
 
+    __slots__ = ("ticket_id", "severity", "description", "assigned_to", "resolved")
+
     def __init__(self, ticket_id, severity, description):
         self.ticket_id = ticket_id
         self.severity = severity
@@ -22,6 +25,8 @@ class SupportTicket:
 # HANDLER INTERFACE
 class SupportHandler(ABC):
 
+    __slots__ = ("_next_handler",)
+
     def __init__(self):
         self._next_handler = None
 
@@ -30,14 +35,15 @@ class SupportHandler(ABC):
         return handler
 
     def handle(self, ticket):
-        if self._can_handle(ticket):
-            self._process(ticket)
-        elif self._next_handler:
-            print(f"{self.__class__.__name__} passing to next handler")
-            self._next_handler.handle(ticket)
-        else:
-            print(f"{self.__class__.__name__}: End of chain, ticket unhandled")
-            ticket.resolved = False
+        handler = self
+        while not handler._can_handle(ticket):
+            if not handler._next_handler:
+                print(f"{handler.__class__.__name__}: End of chain, ticket unhandled")
+                ticket.resolved = False
+                return
+            print(f"{handler.__class__.__name__} passing to next handler")
+            handler = handler._next_handler
+        handler._process(ticket)
 
     @abstractmethod
     def _can_handle(self, ticket):
@@ -53,6 +59,8 @@ class SupportHandler(ABC):
 class Level1Support(SupportHandler):
     """Handles LOW severity tickets"""
 
+    __slots__ = ()
+
     def _can_handle(self, ticket):
         return ticket.severity == SupportTicket.SEVERITY_LOW
 
@@ -66,8 +74,10 @@ class Level1Support(SupportHandler):
 class Level1_5Support(SupportHandler):
     """Handles escalated LOW severity tickets"""
 
+    __slots__ = ()
+
     def _can_handle(self, ticket):
-        return "escalated" in ticket.description.lower() and ticket.severity == SupportTicket.SEVERITY_LOW
+        return ticket.severity == SupportTicket.SEVERITY_LOW and "escalated" in ticket.description.lower()
 
     def _process(self, ticket):
         print(f"\nLevel 1.5 Support handling: {ticket}")
@@ -79,6 +89,8 @@ class Level1_5Support(SupportHandler):
 class Level2Support(SupportHandler):
     """Handles MEDIUM severity tickets"""
 
+    __slots__ = ()
+
     def _can_handle(self, ticket):
         return ticket.severity == SupportTicket.SEVERITY_MEDIUM
 
@@ -92,6 +104,8 @@ class Level2Support(SupportHandler):
 class Level3Support(SupportHandler):
     """Handles HIGH severity tickets"""
 
+    __slots__ = ()
+
     def _can_handle(self, ticket):
         return ticket.severity == SupportTicket.SEVERITY_HIGH
 
@@ -105,6 +119,8 @@ class Level3Support(SupportHandler):
 class ManagementSupport(SupportHandler):
     """Handles CRITICAL severity tickets"""
 
+    __slots__ = ()
+
     def _can_handle(self, ticket):
         return ticket.severity == SupportTicket.SEVERITY_CRITICAL
 
@@ -130,14 +146,10 @@ class ChainType(Enum):
 # chain factory to create different chains based on scenario and reuse them without rebuilding every time.
 class SupportChainFactory:
 
-    _chains = {}  
-
     @staticmethod
+    @functools.cache
     def create_chain(chain_type: ChainType) -> SupportHandler:
 
-        if chain_type in SupportChainFactory._chains:
-            return SupportChainFactory._chains[chain_type]
-
         if chain_type in (ChainType.STANDARD, ChainType.BUSINESS_HOURS):
             level1 = Level1Support()
             level1_5 = Level1_5Support()
@@ -177,7 +189,6 @@ class SupportChainFactory:
         else:
             head = SupportChainFactory.create_chain(ChainType.STANDARD)
 
-        SupportChainFactory._chains[chain_type] = head
         return head
     
     @staticmethod
@@ -1,3 +1,4 @@
+import functools
 from abc import ABC, abstractmethod
 from enum import Enum
 
@@ -9,6 +10,8 @@ class SupportTicket:
     SEVERITY_HIGH = "HIGH"
     SEVERITY_CRITICAL = "CRITICAL"
 
+    __slots__ = ("ticket_id", "severity", "description", "assigned_to", "resolved")
+
     def __init__(self, ticket_id, severity, description):
         self.ticket_id = ticket_id
         self.severity = severity
@@ -22,6 +25,8 @@ class SupportTicket:
 
 class SupportHandler(ABC):
 
+    __slots__ = ("_next_handler",)
+
     def __init__(self):
         self._next_handler = None
 
@@ -30,12 +35,13 @@ class SupportHandler(ABC):
         return handler
 
     def handle(self, ticket):
-        if self._can_handle(ticket):
-            self._process(ticket)
-        elif self._next_handler:
-            self._next_handler.handle(ticket)
-        else:
-            ticket.resolved = False
+        handler = self
+        while not handler._can_handle(ticket):
+            if not handler._next_handler:
+                ticket.resolved = False
+                return
+            handler = handler._next_handler
+        handler._process(ticket)
 
     @abstractmethod
     def _can_handle(self, ticket):
@@ -47,6 +53,8 @@ class SupportHandler(ABC):
 
 
 class Level1Support(SupportHandler):
+    __slots__ = ()
+
     def _can_handle(self, ticket):
         return ticket.severity == SupportTicket.SEVERITY_LOW
 
@@ -57,8 +65,10 @@ class Level1Support(SupportHandler):
 
 
 class Level1_5Support(SupportHandler):
+    __slots__ = ()
+
     def _can_handle(self, ticket):
-        return "escalated" in ticket.description.lower() and ticket.severity == SupportTicket.SEVERITY_LOW
+        return ticket.severity == SupportTicket.SEVERITY_LOW and "escalated" in ticket.description.lower()
 
     def _process(self, ticket):
         print(f"Level 1.5 resolved {ticket}")
@@ -67,6 +77,8 @@ class Level1_5Support(SupportHandler):
 
 
 class Level2Support(SupportHandler):
+    __slots__ = ()
+
     def _can_handle(self, ticket):
         return ticket.severity == SupportTicket.SEVERITY_MEDIUM
 
@@ -77,6 +89,8 @@ class Level2Support(SupportHandler):
 
 
 class Level3Support(SupportHandler):
+    __slots__ = ()
+
     def _can_handle(self, ticket):
         return ticket.severity == SupportTicket.SEVERITY_HIGH
 
@@ -87,6 +101,8 @@ class Level3Support(SupportHandler):
 
 
 class ManagementSupport(SupportHandler):
+    __slots__ = ()
+
     def _can_handle(self, ticket):
         return ticket.severity == SupportTicket.SEVERITY_CRITICAL
 
@@ -153,24 +169,21 @@ class VIPChain(ChainBuilder):
 # FACTORY (no if else)
 class SupportChainFactory:
     _registry = {}
-    _cache = {}
 
     @classmethod
     def register(cls, chain_type: ChainType, builder):
         cls._registry[chain_type] = builder
+        cls.create_chain.cache_clear()
 
+    # built chains are cached per chain type; registering a builder drops stale chains
     @classmethod
+    @functools.cache
     def create_chain(cls, chain_type: ChainType):
-        if chain_type in cls._cache:
-            return cls._cache[chain_type]
-
         builder = cls._registry.get(chain_type)
         if not builder:
             raise ValueError("Chain not registered")
 
-        chain = builder().build()
-        cls._cache[chain_type] = chain
-        return chain
+        return builder().build()
 
 
 # REGISTRATION OF CHAINS
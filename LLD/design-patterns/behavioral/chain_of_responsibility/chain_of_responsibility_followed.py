@@ -7,6 +7,8 @@ class SupportTicket:
     SEVERITY_HIGH = "HIGH"
     SEVERITY_CRITICAL = "CRITICAL"
 
+    __slots__ = ("ticket_id", "severity", "description", "assigned_to", "resolved")
+
     def __init__(self, ticket_id, severity, description):
         self.ticket_id = ticket_id
         self.severity = severity
@@ -22,6 +24,8 @@ class SupportTicket:
 class SupportHandler(ABC):
     """Base handler in the chain."""
 
+    __slots__ = ("_next_handler",)
+
     def __init__(self):
         self._next_handler = None
 
@@ -30,14 +34,15 @@ class SupportHandler(ABC):
         return handler
 
     def handle(self, ticket):
-        if self._can_handle(ticket):
-            self._process(ticket)
-        elif self._next_handler:
-            print(f"{self.__class__.__name__} forwarding request")
-            self._next_handler.handle(ticket)
-        else:
-            print(f"{self.__class__.__name__}: end of chain, unhandled")
-            ticket.resolved = False
+        handler = self
+        while not handler._can_handle(ticket):
+            if not handler._next_handler:
+                print(f"{handler.__class__.__name__}: end of chain, unhandled")
+                ticket.resolved = False
+                return
+            print(f"{handler.__class__.__name__} forwarding request")
+            handler = handler._next_handler
+        handler._process(ticket)
 
     @abstractmethod
     def _can_handle(self, ticket):
@@ -52,6 +57,8 @@ class SupportHandler(ABC):
 class Level1Support(SupportHandler):
     """Handles low severity."""
 
+    __slots__ = ()
+
     def _can_handle(self, ticket):
         return ticket.severity == SupportTicket.SEVERITY_LOW
 
@@ -64,6 +71,8 @@ class Level1Support(SupportHandler):
 class Level2Support(SupportHandler):
     """Handles medium severity."""
 
+    __slots__ = ()
+
     def _can_handle(self, ticket):
         return ticket.severity == SupportTicket.SEVERITY_MEDIUM
 
@@ -76,6 +85,8 @@ class Level2Support(SupportHandler):
 class Level3Support(SupportHandler):
     """Handles high severity."""
 
+    __slots__ = ()
+
     def _can_handle(self, ticket):
         return ticket.severity == SupportTicket.SEVERITY_HIGH
 
@@ -88,6 +99,8 @@ class Level3Support(SupportHandler):
 class ManagementSupport(SupportHandler):
     """Handles critical severity."""
 
+    __slots__ = ()
+
     def _can_handle(self, ticket):
         return ticket.severity == SupportTicket.SEVERITY_CRITICAL
 
@@ -133,6 +146,8 @@ for ticket in tickets:
 # if you Want to add new level of support
 class Level1_5Support(SupportHandler):
 
+    __slots__ = ()
+
     def _can_handle(self, ticket):
         return "escalated" in ticket.description.lower()
 
@@ -161,6 +176,8 @@ level1.handle(ticket)
 # Want to decorate existing handler with logging with decorator pattern
 class LoggingHandler(SupportHandler):
 
+    __slots__ = ("wrapped_handler",)
+
     def __init__(self, handler):
         super().__init__()
         self.wrapped_handler = handler
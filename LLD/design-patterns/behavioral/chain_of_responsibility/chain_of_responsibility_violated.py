@@ -7,6 +7,8 @@ class SupportTicket:
     SEVERITY_HIGH = "HIGH"
     SEVERITY_CRITICAL = "CRITICAL"
 
+    __slots__ = ("ticket_id", "severity", "description", "assigned_to", "resolved")
+
     def __init__(self, ticket_id, severity, description):
         self.ticket_id = ticket_id
         self.severity = severity
@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import List
+from collections import deque
+from typing import Deque, List
+
+HISTORY_LIMIT = 128  # oldest entries are dropped once a history is full
 
 # RECEIVERS
 
 class Light:
     
+    __slots__ = ("location", "is_on")
+    
     def __init__(self, location):
         self.location = location
         self.is_on = False
@@ -20,6 +25,8 @@ class Light:
 
 class Fan:
     
+    __slots__ = ("location", "speed")
+    
     def __init__(self, location):
         self.location = location
         self.speed = 0
@@ -34,6 +41,8 @@ class Fan:
     
     def set_speed(self, speed):
         old_speed = self.speed
+        if speed == old_speed:
+            return old_speed
         self.speed = speed
         print(f"{self.location} fan speed {old_speed} -> {speed}")
         return old_speed
@@ -41,6 +50,8 @@ class Fan:
 
 class AirConditioner:
     
+    __slots__ = ("location", "is_on", "temperature")
+    
     def __init__(self, location):
         self.location = location
         self.is_on = False
@@ -56,6 +67,8 @@ class AirConditioner:
     
     def set_temperature(self, temp):
         old_temp = self.temperature
+        if temp == old_temp:
+            return old_temp
         self.temperature = temp
         if self.is_on:
             print(f"{self.location} AC temperature {old_temp}C -> {temp}C")
@@ -64,6 +77,8 @@ class AirConditioner:
 
 class Television:
     
+    __slots__ = ("location", "is_on", "volume", "channel")
+    
     def __init__(self, location):
         self.location = location
         self.is_on = False
@@ -80,12 +95,16 @@ class Television:
     
     def set_volume(self, volume):
         old_volume = self.volume
+        if volume == old_volume:
+            return old_volume
         self.volume = volume
         print(f"{self.location} TV volume {old_volume} -> {volume}")
         return old_volume
     
     def set_channel(self, channel):
         old_channel = self.channel
+        if channel == old_channel:
+            return old_channel
         self.channel = channel
         print(f"{self.location} TV channel {old_channel} -> {channel}")
         return old_channel
@@ -94,6 +113,8 @@ class Television:
 # COMMAND INTERFACE
 class Command(ABC):
     
+    __slots__ = ()
+    
     @abstractmethod
     def execute(self):
         pass
@@ -106,6 +127,8 @@ class Command(ABC):
 # CONCRETE COMMANDS - Light
 
 class LightOnCommand(Command):
+    __slots__ = ("light",)
+
     def __init__(self, light: Light):
         self.light = light
     
@@ -117,6 +140,8 @@ class LightOnCommand(Command):
 
 
 class LightOffCommand(Command):
+    __slots__ = ("light",)
+
     def __init__(self, light: Light):
         self.light = light
     
@@ -130,6 +155,8 @@ class LightOffCommand(Command):
 # CONCRETE COMMANDS - Fan
 
 class FanOnCommand(Command):
+    __slots__ = ("fan", "speed", "previous_speed")
+
     def __init__(self, fan: Fan, speed=3):
         self.fan = fan
         self.speed = speed
@@ -147,6 +174,8 @@ class FanOnCommand(Command):
 
 
 class FanOffCommand(Command):
+    __slots__ = ("fan", "previous_speed")
+
     def __init__(self, fan: Fan):
         self.fan = fan
         self.previous_speed = 0
@@ -160,6 +189,8 @@ class FanOffCommand(Command):
 
 
 class FanSpeedCommand(Command):
+    __slots__ = ("fan", "speed", "previous_speed")
+
     def __init__(self, fan: Fan, speed: int):
         self.fan = fan
         self.speed = speed
@@ -175,6 +206,8 @@ class FanSpeedCommand(Command):
 # CONCRETE COMMANDS - Air Conditioner
 
 class ACOnCommand(Command):
+    __slots__ = ("ac",)
+
     def __init__(self, ac: AirConditioner):
         self.ac = ac
     
@@ -186,6 +219,8 @@ class ACOnCommand(Command):
 
 
 class ACOffCommand(Command):
+    __slots__ = ("ac",)
+
     def __init__(self, ac: AirConditioner):
         self.ac = ac
     
@@ -197,6 +232,8 @@ class ACOffCommand(Command):
 
 
 class ACTemperatureCommand(Command):
+    __slots__ = ("ac", "temperature", "previous_temperature")
+
     def __init__(self, ac: AirConditioner, temperature: int):
         self.ac = ac
         self.temperature = temperature
@@ -212,6 +249,8 @@ class ACTemperatureCommand(Command):
 # CONCRETE COMMANDS - Television
 
 class TVOnCommand(Command):
+    __slots__ = ("tv",)
+
     def __init__(self, tv: Television):
         self.tv = tv
     
@@ -223,6 +262,8 @@ class TVOnCommand(Command):
 
 
 class TVOffCommand(Command):
+    __slots__ = ("tv",)
+
     def __init__(self, tv: Television):
         self.tv = tv
     
@@ -234,6 +275,8 @@ class TVOffCommand(Command):
 
 
 class TVVolumeCommand(Command):
+    __slots__ = ("tv", "volume", "previous_volume")
+
     def __init__(self, tv: Television, volume: int):
         self.tv = tv
         self.volume = volume
@@ -247,6 +290,8 @@ class TVVolumeCommand(Command):
 
 
 class TVChannelCommand(Command):
+    __slots__ = ("tv", "channel", "previous_channel")
+
     def __init__(self, tv: Television, channel: int):
         self.tv = tv
         self.channel = channel
@@ -262,15 +307,18 @@ class TVChannelCommand(Command):
 # MACRO COMMAND execute multiple commands as a single command
 class MacroCommand(Command):
     
+    __slots__ = ("commands", "_undo_order")
+    
     def __init__(self, commands: List[Command]):
-        self.commands = commands
+        self.commands = tuple(commands)
+        self._undo_order = self.commands[::-1]
     
     def execute(self):
         for command in self.commands:
             command.execute()
     
     def undo(self):
-        for command in reversed(self.commands):
+        for command in self._undo_order:
             command.undo()
 
 
@@ -278,13 +326,14 @@ class MacroCommand(Command):
 class RemoteControl:
     
     def __init__(self):
-        self.command_history: List[Command] = []
-        self.undo_history: List[Command] = []
+        self.command_history: Deque[Command] = deque(maxlen=HISTORY_LIMIT)
+        self.undo_history: Deque[Command] = deque(maxlen=HISTORY_LIMIT)
     
     def execute_command(self, command: Command):
         command.execute()
         self.command_history.append(command)
-        self.undo_history.clear() # Clear redo history on new command
+        if self.undo_history:
+            self.undo_history.clear() # Clear redo history on new command
     
     def undo(self):
         if not self.command_history:
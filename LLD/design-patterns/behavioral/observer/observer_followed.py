@@ -25,28 +25,33 @@ class Observer(ABC):
 class WeatherStation(Subject):
 
     def __init__(self):
-        self._observers = []
+        self._observers = {}  # insertion-ordered set of observers
+        self._update_callbacks = ()  # bound update methods, rebuilt on register/remove
         self._temperature = 0
         self._humidity = 0
         self._pressure = 0
+        self._has_reading = False
 
     def register_observer(self, observer: Observer):
         if observer not in self._observers:
-            self._observers.append(observer)
+            self._observers[observer] = None
+            self._update_callbacks = tuple(o.update for o in self._observers)
 
     def remove_observer(self, observer: Observer):
         if observer in self._observers:
-            self._observers.remove(observer)
+            del self._observers[observer]
+            self._update_callbacks = tuple(o.update for o in self._observers)
 
     def notify_observers(self):
-        for observer in self._observers:
-            observer.update(
-                self._temperature,
-                self._humidity,
-                self._pressure
-            )
+        temperature, humidity, pressure = self._temperature, self._humidity, self._pressure
+        for update in self._update_callbacks:
+            update(temperature, humidity, pressure)
 
     def set_measurements(self, temperature, humidity, pressure):
+        # Unchanged readings would only repeat the last notification
+        if self._has_reading and (temperature, humidity, pressure) == (self._temperature, self._humidity, self._pressure):
+            return
+
         print(f"\n{'='*60}")
         print("Weather Station: New measurements")
         print(f"{'='*60}")
@@ -57,6 +62,7 @@ class WeatherStation(Subject):
         self._temperature = temperature
         self._humidity = humidity
         self._pressure = pressure
+        self._has_reading = True
 
         self.notify_observers()
         
@@ -101,15 +107,24 @@ class WebsiteDisplay(Observer):
 
 
 class StatisticsDisplay(Observer):
+    # running aggregates keep each update O(1) instead of re-scanning every reading
     def __init__(self):
-        self.temps = []
+        self._count = 0
+        self._total = 0
+        self._max_temp = float("-inf")
+        self._min_temp = float("inf")
 
     def update(self, temperature, humidity, pressure):
-        self.temps.append(temperature)
-        avg_temp = sum(self.temps) / len(self.temps)
+        self._count += 1
+        self._total += temperature
+        if temperature > self._max_temp:
+            self._max_temp = temperature
+        if temperature < self._min_temp:
+            self._min_temp = temperature
+        avg_temp = self._total / self._count
 
         print("\nStatistics Display")
-        print(f"Avg: {avg_temp:.1f}°C, Max: {max(self.temps)}°C, Min: {min(self.temps)}°C")
+        print(f"Avg: {avg_temp:.1f}°C, Max: {self._max_temp}°C, Min: {self._min_temp}°C")
 
 
 class AlertSystem(Observer):
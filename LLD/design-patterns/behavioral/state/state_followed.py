@@ -3,25 +3,38 @@ from abc import ABC, abstractmethod
 # CONTEXT - Vending Machine
 class VendingMachine:
     
+    __slots__ = (
+        "item_count",
+        "inserted_money",
+        "item_price",
+        "idle_state",
+        "has_money_state",
+        "dispensing_state",
+        "out_of_stock_state",
+        "_state",
+        "_state_name",
+    )
+    
     def __init__(self, item_count):
         self.item_count = item_count
         self.inserted_money = 0
         self.item_price = 50
         
         # Initialize states
-        self._idle_state = IdleState(self)
-        self._has_money_state = HasMoneyState(self)
-        self._dispensing_state = DispensingState(self)
-        self._out_of_stock_state = OutOfStockState(self)
+        self.idle_state = IdleState(self)
+        self.has_money_state = HasMoneyState(self)
+        self.dispensing_state = DispensingState(self)
+        self.out_of_stock_state = OutOfStockState(self)
         
         # Initial state
         if item_count > 0:
-            self._state = self._idle_state
+            self.set_state(self.idle_state)
         else:
-            self._state = self._out_of_stock_state
+            self.set_state(self.out_of_stock_state)
     
     def set_state(self, state):
         self._state = state
+        self._state_name = type(state).__name__
     
     def insert_money(self, amount):
         return self._state.insert_money(amount)
@@ -35,28 +48,17 @@ class VendingMachine:
     def refill(self, count):
         return self._state.refill(count)
     
-    # State getters
-    def get_idle_state(self):
-        return self._idle_state
-    
-    def get_has_money_state(self):
-        return self._has_money_state
-    
-    def get_dispensing_state(self):
-        return self._dispensing_state
-    
-    def get_out_of_stock_state(self):
-        return self._out_of_stock_state
-    
     def get_status(self):
         print("\n[VendingMachine Status]")
-        print(f"State  : {self._state.__class__.__name__}")
+        print(f"State  : {self._state_name}")
         print(f"Items  : {self.item_count}")
         print(f"Money  : ₹{self.inserted_money}")
 
 
 # STATE INTERFACE
 class VendingMachineState(ABC):
+    
+    __slots__ = ("machine",)
 
     def __init__(self, machine: VendingMachine):
         self.machine = machine
@@ -76,11 +78,17 @@ class VendingMachineState(ABC):
     @abstractmethod
     def refill(self, count):
         pass
+    
+    def _restock(self, count):
+        self.machine.item_count += count
+        print(f"Refill complete. Total items = {self.machine.item_count}")
 
 
 # CONCRETE STATES
 
 class IdleState(VendingMachineState):
+    
+    __slots__ = ()
 
     def insert_money(self, amount):
         print(f"\n[IdleState] Insert money: ₹{amount}")
@@ -88,7 +96,7 @@ class IdleState(VendingMachineState):
         print(f"Money accepted. Total = ₹{self.machine.inserted_money}")
         print(f"Item price = ₹{self.machine.item_price}")
         
-        self.machine.set_state(self.machine.get_has_money_state())
+        self.machine.set_state(self.machine.has_money_state)
         return True
     
     def eject_money(self):
@@ -103,13 +111,14 @@ class IdleState(VendingMachineState):
     
     def refill(self, count):
         print(f"\n[IdleState] Refill machine with {count} items")
-        self.machine.item_count += count
-        print(f"Refill complete. Total items = {self.machine.item_count}")
+        self._restock(count)
         return True
 
 
 class HasMoneyState(VendingMachineState):
     
+    __slots__ = ()
+    
     def insert_money(self, amount):
         print(f"\n[HasMoneyState] Insert money: ₹{amount}")
         self.machine.inserted_money += amount
@@ -120,7 +129,7 @@ class HasMoneyState(VendingMachineState):
         print("\n[HasMoneyState] Eject money")
         print(f"Returning ₹{self.machine.inserted_money}")
         self.machine.inserted_money = 0
-        self.machine.set_state(self.machine.get_idle_state())
+        self.machine.set_state(self.machine.idle_state)
         return True
     
     def dispense(self):
@@ -128,7 +137,7 @@ class HasMoneyState(VendingMachineState):
         
         if self.machine.inserted_money >= self.machine.item_price:
             print("Sufficient money. Dispensing item")
-            self.machine.set_state(self.machine.get_dispensing_state())
+            self.machine.set_state(self.machine.dispensing_state)
             
             self.machine.item_count -= 1
             change = self.machine.inserted_money - self.machine.item_price
@@ -139,10 +148,10 @@ class HasMoneyState(VendingMachineState):
                 print(f"Returning change = ₹{change}")
             
             if self.machine.item_count == 0:
-                self.machine.set_state(self.machine.get_out_of_stock_state())
+                self.machine.set_state(self.machine.out_of_stock_state)
                 print("Machine is now out of stock")
             else:
-                self.machine.set_state(self.machine.get_idle_state())
+                self.machine.set_state(self.machine.idle_state)
                 print(f"Items remaining = {self.machine.item_count}")
             
             return True
@@ -159,6 +168,8 @@ class HasMoneyState(VendingMachineState):
 
 class DispensingState(VendingMachineState):
     
+    __slots__ = ()
+    
     def insert_money(self, amount):
         print(f"\n[DispensingState] Insert money: ₹{amount}")
         print("Please wait. Dispensing in progress")
@@ -181,6 +192,8 @@ class DispensingState(VendingMachineState):
 
 
 class OutOfStockState(VendingMachineState):
+    
+    __slots__ = ()
 
     def insert_money(self, amount):
         print(f"\n[OutOfStockState] Insert money: ₹{amount}")
@@ -204,9 +217,8 @@ class OutOfStockState(VendingMachineState):
     
     def refill(self, count):
         print(f"\n[OutOfStockState] Refill machine with {count} items")
-        self.machine.item_count += count
-        print(f"Refill complete. Total items = {self.machine.item_count}")
-        self.machine.set_state(self.machine.get_idle_state())
+        self._restock(count)
+        self.machine.set_state(self.machine.idle_state)
         return True
 
 
@@ -6,6 +6,8 @@ class VendingMachine:
     DISPENSING = "DISPENSING"
     OUT_OF_STOCK = "OUT_OF_STOCK"
     
+    __slots__ = ("state", "item_count", "inserted_money", "item_price")
+    
     def __init__(self, item_count):
         self.state = self.IDLE
         self.item_count = item_count
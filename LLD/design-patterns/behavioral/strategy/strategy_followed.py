@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 class PaymentStrategy(ABC):
     
+    __slots__ = ()
+    
     @abstractmethod
     def pay(self, amount: float) -> bool:
         pass
@@ -13,15 +15,19 @@ class PaymentStrategy(ABC):
 
 class CreditCardPayment(PaymentStrategy):
     
+    __slots__ = ()
+    
+    FEE_RATE = 0.03
+    
     def pay(self, amount: float) -> bool:
         print("Payment Type: Credit Card")
         print("Step 1: Validating card number...")
         print("Step 2: Checking card expiry...")
         print("Step 3: Verifying CVV...")
         print("Step 4: Processing payment through card network...")
-        fee = amount * 0.03
+        fee = amount * self.FEE_RATE
         total = amount + fee
-        print(f"Transaction Fee: ${fee:.2f} (3%)")
+        print(f"Transaction Fee: ${fee:.2f} ({self.FEE_RATE:.0%})")
         print(f"Total Amount: ${total:.2f}")
         print("✓ Credit Card Payment Successful!")
         return True
@@ -32,14 +38,18 @@ class CreditCardPayment(PaymentStrategy):
 
 class PayPalPayment(PaymentStrategy):
     
+    __slots__ = ()
+    
+    FEE_RATE = 0.04
+    
     def pay(self, amount: float) -> bool:
         print("Payment Type: PayPal")
         print("Step 1: Redirecting to PayPal...")
         print("Step 2: Authenticating user...")
         print("Step 3: Processing payment through PayPal...")
-        fee = amount * 0.04
+        fee = amount * self.FEE_RATE
         total = amount + fee
-        print(f"Transaction Fee: ${fee:.2f} (4%)")
+        print(f"Transaction Fee: ${fee:.2f} ({self.FEE_RATE:.0%})")
         print(f"Total Amount: ${total:.2f}")
         print("✓ PayPal Payment Successful!")
         return True
@@ -50,6 +60,8 @@ class PayPalPayment(PaymentStrategy):
 
 class BankTransferPayment(PaymentStrategy):
     
+    __slots__ = ()
+    
     def pay(self, amount: float) -> bool:
         print("Payment Type: Bank Transfer")
         print("Step 1: Validating account number...")
@@ -68,14 +80,18 @@ class BankTransferPayment(PaymentStrategy):
 
 class CryptocurrencyPayment(PaymentStrategy):
     
+    __slots__ = ()
+    
+    FEE_RATE = 0.01
+    
     def pay(self, amount: float) -> bool:
         print("Payment Type: Cryptocurrency")
         print("Step 1: Generating wallet address...")
         print("Step 2: Waiting for blockchain confirmation...")
         print("Step 3: Verifying transaction...")
-        fee = amount * 0.01
+        fee = amount * self.FEE_RATE
         total = amount + fee
-        print(f"Transaction Fee: ${fee:.2f} (1%)")
+        print(f"Transaction Fee: ${fee:.2f} ({self.FEE_RATE:.0%})")
         print(f"Total Amount: ${total:.2f}")
         print("✓ Cryptocurrency Payment Successful!")
         return True
@@ -86,13 +102,17 @@ class CryptocurrencyPayment(PaymentStrategy):
 
 class GooglePayPayment(PaymentStrategy):
     
+    __slots__ = ()
+    
+    FEE_RATE = 0.02
+    
     def pay(self, amount: float) -> bool:
         print("Payment Type: Google Pay")
         print("Step 1: Authenticating via Google...")
         print("Step 2: Processing payment...")
-        fee = amount * 0.02
+        fee = amount * self.FEE_RATE
         total = amount + fee
-        print(f"Transaction Fee: ${fee:.2f} (2%)")
+        print(f"Transaction Fee: ${fee:.2f} ({self.FEE_RATE:.0%})")
         print(f"Total Amount: ${total:.2f}")
         print("✓ Google Pay Payment Successful!")
         return True
@@ -103,6 +123,8 @@ class GooglePayPayment(PaymentStrategy):
 
 class PaymentProcessor:
     
+    __slots__ = ("_strategy",)
+    
     def __init__(self, strategy: PaymentStrategy):
         self._strategy = strategy
     
@@ -141,15 +163,17 @@ print("DYNAMIC STRATEGY SELECTION:")
 print("="*60)
 
 
+STRATEGIES = {
+    "credit": CreditCardPayment(),
+    "paypal": PayPalPayment(),
+    "bank": BankTransferPayment(),
+    "crypto": CryptocurrencyPayment(),
+    "gpay": GooglePayPayment()
+}
+
+
 def get_payment_strategy(method: str) -> PaymentStrategy:
-    strategies = {
-        "credit": CreditCardPayment(),
-        "paypal": PayPalPayment(),
-        "bank": BankTransferPayment(),
-        "crypto": CryptocurrencyPayment(),
-        "gpay": GooglePayPayment()
-    }
-    return strategies.get(method, CreditCardPayment())
+    return STRATEGIES.get(method, STRATEGIES["credit"])
 
 # User choosing payment method
 user_choice = "crypto"
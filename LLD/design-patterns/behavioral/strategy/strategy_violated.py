@@ -1,5 +1,7 @@
 class PaymentProcessor:
     
+    __slots__ = ("payment_type",)
+    
     def __init__(self, payment_type):
         self.payment_type = payment_type
     
@@ -1,6 +1,40 @@
+SPEC_BAR = "=" * 50
+
 # computer class Constructor with many optional parameters
 class Computer:
 
+    __slots__ = (
+        "cpu",
+        "ram",
+        "storage",
+        "gpu",
+        "wifi",
+        "bluetooth",
+        "cooling_system",
+        "rgb_lighting",
+        "operating_system",
+        "monitor",
+        "keyboard",
+        "mouse",
+        "speakers",
+        "webcam",
+        "case_type",
+    )
+
+    OPTIONAL_SPECS = (
+        ("gpu", "GPU: {}"),
+        ("wifi", "WiFi: Enabled"),
+        ("bluetooth", "Bluetooth: Enabled"),
+        ("cooling_system", "Cooling: {}"),
+        ("rgb_lighting", "RGB Lighting: Yes"),
+        ("operating_system", "OS: {}"),
+        ("monitor", "Monitor: {}"),
+        ("keyboard", "Keyboard: {}"),
+        ("mouse", "Mouse: {}"),
+        ("speakers", "Speakers: Included"),
+        ("webcam", "Webcam: Included"),
+    )
+
     def __init__(
         self,
         cpu,
@@ -36,38 +70,20 @@ class Computer:
         self.case_type = case_type
     
     def __str__(self):
-        specs = f"\n{'='*50}\n COMPUTER SPECIFICATIONS\n{'='*50}\n"
-        specs += f"CPU: {self.cpu}\n"
-        specs += f"RAM: {self.ram}GB\n"
-        specs += f"Storage: {self.storage}GB SSD\n"
+        specs = ["", SPEC_BAR, " COMPUTER SPECIFICATIONS", SPEC_BAR]
+        specs.append(f"CPU: {self.cpu}")
+        specs.append(f"RAM: {self.ram}GB")
+        specs.append(f"Storage: {self.storage}GB SSD")
         
-        if self.gpu:
-            specs += f"GPU: {self.gpu}\n"
-        if self.wifi:
-            specs += f"WiFi: Enabled\n"
-        if self.bluetooth:
-            specs += f"Bluetooth: Enabled\n"
-        if self.cooling_system:
-            specs += f"Cooling: {self.cooling_system}\n"
-        if self.rgb_lighting:
-            specs += f"RGB Lighting: Yes\n"
-        if self.operating_system:
-            specs += f"OS: {self.operating_system}\n"
-        if self.monitor:
-            specs += f"Monitor: {self.monitor}\n"
-        if self.keyboard:
-            specs += f"Keyboard: {self.keyboard}\n"
-        if self.mouse:
-            specs += f"Mouse: {self.mouse}\n"
-        if self.speakers:
-            specs += f"Speakers: Included\n"
-        if self.webcam:
-            specs += f"Webcam: Included\n"
+        for attr, template in self.OPTIONAL_SPECS:
+            value = getattr(self, attr)
+            if value:
+                specs.append(template.format(value))
         
-        specs += f"Case: {self.case_type}\n"
-        specs += f"{'='*50}"
+        specs.append(f"Case: {self.case_type}")
+        specs.append(SPEC_BAR)
         
-        return specs
+        return "\n".join(specs)
 
 
 # Usage
@@ -145,16 +145,17 @@ class Application:
 
 
 #  Factory Method (Factory of Factories) 
+FACTORIES = {
+    "Windows": WindowsFactory(),
+    "Mac": MacFactory(),
+    "Linux": LinuxFactory()
+}
+
+
 class GUIFactoryCreator:
     @staticmethod
     def get_factory(os_type: str) -> GUIFactory:
-        factories = {
-            "Windows": WindowsFactory(),
-            "Mac": MacFactory(),
-            "Linux": LinuxFactory()
-        }
-
-        factory = factories.get(os_type)
+        factory = FACTORIES.get(os_type)
         if not factory:
             raise ValueError(f"Unsupported OS: {os_type}")
 
@@ -5,6 +5,8 @@ from datetime import datetime
 # BASIC SINGLETON (Double-Checked Locking)
 class DatabaseConnection:
 
+    __slots__ = ("connection_id", "host", "port", "database", "query_count")
+
     _instance = None
     _lock = threading.Lock()
     
@@ -68,6 +70,8 @@ class SingletonMeta(type):
 
 class ConfigurationManager(metaclass=SingletonMeta):
     
+    __slots__ = ("config", "_initialized")
+    
     _init_lock= threading.Lock()
 
     def __init__(self):
@@ -102,15 +106,16 @@ class ConfigurationManager(metaclass=SingletonMeta):
 
 # DECORATOR SINGLETON
 def singleton(cls):
-    instances = {}
+    instance = None
     lock = threading.Lock()
     
     def get_instance(*args, **kwargs):
-        if cls not in instances:
+        nonlocal instance
+        if instance is None:
             with lock:
-                if cls not in instances:
-                    instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
+                if instance is None:
+                    instance = cls(*args, **kwargs)
+        return instance
     
     return get_instance
 
@@ -118,6 +123,8 @@ def singleton(cls):
 @singleton
 class Logger:
     
+    __slots__ = ("log_file", "log_count", "logs")
+    
     def __init__(self, log_file="app.log"):
         print("\n[Logger] Creating singleton logger")
         print(f"[Logger] Instance id={id(self)}")
@@ -129,7 +136,7 @@ class Logger:
     
     def log(self, level, message):
         self.log_count += 1
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S")
         entry = f"[{timestamp}] [{level}] {message}"
         self.logs.append(entry)
         print(f"{entry} (logger_id={id(self)}, count={self.log_count})")
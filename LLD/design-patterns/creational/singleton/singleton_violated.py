@@ -62,7 +62,7 @@ class Logger:
     
     def log(self, level, message):
         self.log_count += 1
-        timestamp = datetime.now().strftime('%H:%M:%S')
+        timestamp = time.strftime('%H:%M:%S')
         print(
             f"[{timestamp}] [{level}] {message} "
             f"(logger_id={id(self)}, count={self.log_count})"
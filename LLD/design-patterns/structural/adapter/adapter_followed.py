@@ -78,9 +78,9 @@ class StripeAdapter(PaymentProcessor):
         )
 
         return {
-            "status": "success" if result.get("paid") else "failed",
-            "transaction_id": result.get("charge_id"),
-            "amount": result.get("amount") / 100
+            "status": "success" if result["paid"] else "failed",
+            "transaction_id": result["charge_id"],
+            "amount": result["amount"] / 100
         }
 
 
@@ -97,9 +97,9 @@ class PayPalAdapter(PaymentProcessor):
         )
 
         return {
-            "status": "success" if result.get("state") == "approved" else "failed",
-            "transaction_id": result.get("payment_id"),
-            "amount": result.get("total")
+            "status": "success" if result["state"] == "approved" else "failed",
+            "transaction_id": result["payment_id"],
+            "amount": result["total"]
         }
 
 
@@ -116,9 +116,9 @@ class RazorpayAdapter(PaymentProcessor):
         )
 
         return {
-            "status": "success" if result.get("success") else "failed",
-            "transaction_id": result.get("txn_id"),
-            "amount": result.get("price")
+            "status": "success" if result["success"] else "failed",
+            "transaction_id": result["txn_id"],
+            "amount": result["price"]
         }
 
 
@@ -208,9 +208,9 @@ class SquareAdapter(PaymentProcessor):
         result = self.square.process_transaction(amount, currency, customer_email)
 
         return {
-            "status": "success" if result.get("txn_status") == "completed" else "failed",
-            "transaction_id": result.get("ref_id"),
-            "amount": result.get("amt")
+            "status": "success" if result["txn_status"] == "completed" else "failed",
+            "transaction_id": result["ref_id"],
+            "amount": result["amt"]
         }
 
 print("\nUsing Square via Adapter")
@@ -3,6 +3,8 @@ from abc import ABC, abstractmethod
 # COMPONENT INTERFACE
 class Coffee(ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def get_description(self) -> str:
         pass
@@ -14,6 +16,8 @@ class Coffee(ABC):
 # CONCRETE COMPONENTS (Base Coffees)
 class SimpleCoffee(Coffee):
 
+    __slots__ = ()
+
     def get_description(self) -> str:
         return "Simple Coffee"
 
@@ -23,6 +27,8 @@ class SimpleCoffee(Coffee):
 
 class Espresso(Coffee):
 
+    __slots__ = ()
+
     def get_description(self) -> str:
         return "Espresso"
 
@@ -32,6 +38,8 @@ class Espresso(Coffee):
 
 class Cappuccino(Coffee):
 
+    __slots__ = ()
+
     def get_description(self) -> str:
         return "Cappuccino"
 
@@ -41,6 +49,8 @@ class Cappuccino(Coffee):
 # DECORATOR BASE CLASS
 class CoffeeDecorator(Coffee):
 
+    __slots__ = ("_coffee",)
+
     def __init__(self, coffee: Coffee):
         self._coffee = coffee
 
@@ -53,6 +63,8 @@ class CoffeeDecorator(Coffee):
 # CONCRETE DECORATORS
 class MilkDecorator(CoffeeDecorator):
 
+    __slots__ = ()
+
     def get_description(self) -> str:
         return f"{self._coffee.get_description()} + Milk"
 
@@ -62,6 +74,8 @@ class MilkDecorator(CoffeeDecorator):
 
 class SugarDecorator(CoffeeDecorator):
 
+    __slots__ = ()
+
     def get_description(self) -> str:
         return f"{self._coffee.get_description()} + Sugar"
 
@@ -71,6 +85,8 @@ class SugarDecorator(CoffeeDecorator):
 
 class WhippedCreamDecorator(CoffeeDecorator):
 
+    __slots__ = ()
+
     def get_description(self) -> str:
         return f"{self._coffee.get_description()} + Whipped Cream"
 
@@ -80,6 +96,8 @@ class WhippedCreamDecorator(CoffeeDecorator):
 
 class CaramelDecorator(CoffeeDecorator):
 
+    __slots__ = ()
+
     def get_description(self) -> str:
         return f"{self._coffee.get_description()} + Caramel"
 
@@ -89,6 +107,8 @@ class CaramelDecorator(CoffeeDecorator):
 
 class VanillaDecorator(CoffeeDecorator):
 
+    __slots__ = ()
+
     def get_description(self) -> str:
         return f"{self._coffee.get_description()} + Vanilla"
 
@@ -98,6 +118,8 @@ class VanillaDecorator(CoffeeDecorator):
 
 class ChocolateDecorator(CoffeeDecorator):
 
+    __slots__ = ()
+
     def get_description(self) -> str:
         return f"{self._coffee.get_description()} + Chocolate"
 
@@ -171,6 +193,8 @@ display_coffee(
 # ADDING NEW COFFEE DECORATOR WITHOUT MODIFYING OLD CODE
 class CinnamonDecorator(CoffeeDecorator):
 
+    __slots__ = ()
+
     def get_description(self) -> str:
         return f"{self._coffee.get_description()} + Cinnamon"
 
@@ -185,22 +209,23 @@ display_coffee(
 )
 
 # RUNTIME CUSTOMIZATION
+ADD_ONS = {
+    "milk": MilkDecorator,
+    "sugar": SugarDecorator,
+    "cream": WhippedCreamDecorator,
+    "caramel": CaramelDecorator,
+    "vanilla": VanillaDecorator,
+    "chocolate": ChocolateDecorator,
+}
+
+
 def customize_coffee(base: Coffee, extras: list[str]) -> Coffee:
     coffee = base
 
     for extra in extras:
-        if extra == "milk":
-            coffee = MilkDecorator(coffee)
-        elif extra == "sugar":
-            coffee = SugarDecorator(coffee)
-        elif extra == "cream":
-            coffee = WhippedCreamDecorator(coffee)
-        elif extra == "caramel":
-            coffee = CaramelDecorator(coffee)
-        elif extra == "vanilla":
-            coffee = VanillaDecorator(coffee)
-        elif extra == "chocolate":
-            coffee = ChocolateDecorator(coffee)
+        decorator = ADD_ONS.get(extra)
+        if decorator:
+            coffee = decorator(coffee)
 
     return coffee
 
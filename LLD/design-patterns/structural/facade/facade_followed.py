@@ -1,5 +1,10 @@
+SEPARATOR = "-" * 50
+
+
 class SecuritySystem:
     
+    __slots__ = ()
+    
     def arm_system(self):
         print("SecuritySystem: arming system")
         print(" - checking sensors")
@@ -19,6 +24,8 @@ class SecuritySystem:
 
 class LightingSystem:
     
+    __slots__ = ()
+    
     def turn_on_all_lights(self):
         print("LightingSystem: turning ON all lights")
         print(" - all rooms ON")
@@ -37,6 +44,8 @@ class LightingSystem:
 
 class ClimateControl:
     
+    __slots__ = ()
+    
     def set_temperature(self, temp):
         print(f"ClimateControl: temperature set to {temp}C")
         print(" - thermostat adjusted")
@@ -56,6 +65,8 @@ class ClimateControl:
 
 class EntertainmentSystem:
     
+    __slots__ = ()
+    
     def turn_on_tv(self):
         print("EntertainmentSystem: TV ON")
     
@@ -78,6 +89,8 @@ class EntertainmentSystem:
 
 class WindowBlinds:
     
+    __slots__ = ()
+    
     def open_all_blinds(self):
         print("WindowBlinds: opening all blinds")
     
@@ -90,6 +103,8 @@ class WindowBlinds:
 
 class DoorLocks:
     
+    __slots__ = ()
+    
     def lock_all_doors(self):
         print("DoorLocks: locking all doors")
         print(" - all doors LOCKED")
@@ -101,6 +116,8 @@ class DoorLocks:
 
 class GarageDoor:
     
+    __slots__ = ()
+    
     def open_garage(self):
         print("GarageDoor: opening garage")
         print(" - garage open")
@@ -113,6 +130,16 @@ class GarageDoor:
 # Facade providing simplified interface for smart home operations
 class SmartHomeFacade:
     
+    __slots__ = (
+        "_security",
+        "_lights",
+        "_climate",
+        "_entertainment",
+        "_blinds",
+        "_locks",
+        "_garage",
+    )
+    
     def __init__(self):
         self._security = SecuritySystem()
         self._lights = LightingSystem()
@@ -126,7 +153,7 @@ class SmartHomeFacade:
 
     def leave_home(self):
         print("\n[Facade] Leaving home sequence started")
-        print("-" * 50)
+        print(SEPARATOR)
         
         self._entertainment.turn_off_tv()
         self._entertainment.turn_off_sound_system()
@@ -137,12 +164,12 @@ class SmartHomeFacade:
         self._security.arm_system()
         self._garage.open_garage()
         
-        print("-" * 50)
+        print(SEPARATOR)
         print("[Facade] Home ready for departure")
     
     def arrive_home(self):
         print("\n[Facade] Arriving home sequence started")
-        print("-" * 50)
+        print(SEPARATOR)
         
         self._garage.close_garage()
         self._security.disarm_system()
@@ -152,12 +179,12 @@ class SmartHomeFacade:
         self._climate.set_temperature(22)
         self._blinds.open_all_blinds()
         
-        print("-" * 50)
+        print(SEPARATOR)
         print("[Facade] Home ready for use")
     
     def movie_night(self):
         print("\n[Facade] Movie night setup started")
-        print("-" * 50)
+        print(SEPARATOR)
         
         self._lights.set_mood_lighting("cinema")
         self._lights.set_brightness(20)
@@ -168,12 +195,12 @@ class SmartHomeFacade:
         self._entertainment.set_volume(60)
         self._entertainment.start_streaming("Netflix")
         
-        print("-" * 50)
+        print(SEPARATOR)
         print("[Facade] Movie night ready")
     
     def sleep_mode(self):
         print("\n[Facade] Sleep mode started")
-        print("-" * 50)
+        print(SEPARATOR)
         
         self._entertainment.turn_off_tv()
         self._entertainment.turn_off_sound_system()
@@ -183,12 +210,12 @@ class SmartHomeFacade:
         self._locks.lock_all_doors()
         self._security.arm_system()
         
-        print("-" * 50)
+        print(SEPARATOR)
         print("[Facade] Sleep mode active")
     
     def party_mode(self):
         print("\n[Facade] Party mode started")
-        print("-" * 50)
+        print(SEPARATOR)
         
         self._lights.set_mood_lighting("party")
         self._lights.set_brightness(80)
@@ -197,12 +224,12 @@ class SmartHomeFacade:
         self._entertainment.set_volume(75)
         self._security.disarm_system()
         
-        print("-" * 50)
+        print(SEPARATOR)
         print("[Facade] Party mode active")
     
     def vacation_mode(self):
         print("\n[Facade] Vacation mode started")
-        print("-" * 50)
+        print(SEPARATOR)
         
         self._lights.turn_off_all_lights()
         self._entertainment.turn_off_tv()
@@ -212,18 +239,18 @@ class SmartHomeFacade:
         self._locks.lock_all_doors()
         self._security.arm_system()
         
-        print("-" * 50)
+        print(SEPARATOR)
         print("[Facade] Home secured for vacation")
     
     def emergency_mode(self):
         print("\n[Facade] EMERGENCY mode started")
-        print("-" * 50)
+        print(SEPARATOR)
         
         self._security.set_panic_mode()
         self._lights.turn_on_all_lights()
         self._locks.unlock_all_doors()
         
-        print("-" * 50)
+        print(SEPARATOR)
         print("[Facade] Emergency handling active")
     
     # Optional direct access
@@ -2,6 +2,8 @@
 
 class SecuritySystem:
 
+    __slots__ = ()
+
     def arm_system(self):
         print("SecuritySystem: arming system...")
         print(" - checking all sensors")
@@ -24,6 +26,8 @@ class SecuritySystem:
 
 class LightingSystem:
     
+    __slots__ = ()
+    
     def turn_on_all_lights(self):
         print("LightingSystem: turning ON all lights")
         print(" - living room ON")
@@ -50,6 +54,8 @@ class LightingSystem:
 class ClimateControl:
     """HVAC and climate control system"""
     
+    __slots__ = ()
+    
     def set_temperature(self, temp):
         print(f"ClimateControl: setting temperature to {temp}C")
         print(" - thermostat adjusted")
@@ -71,6 +77,8 @@ class ClimateControl:
 
 class EntertainmentSystem:
     
+    __slots__ = ()
+    
     def turn_on_tv(self):
         print("EntertainmentSystem: TV ON")
     
@@ -97,6 +105,8 @@ class EntertainmentSystem:
 
 class WindowBlinds:
     
+    __slots__ = ()
+    
     def open_all_blinds(self):
         print("WindowBlinds: opening all blinds")
         print(" - living room OPEN")
@@ -113,6 +123,8 @@ class WindowBlinds:
 
 class DoorLocks:
     
+    __slots__ = ()
+    
     def lock_all_doors(self):
         print("DoorLocks: locking all doors")
         print(" - front door LOCKED")
@@ -127,6 +139,8 @@ class DoorLocks:
 
 class GarageDoor:
     
+    __slots__ = ()
+    
     def open_garage(self):
         print("GarageDoor: opening garage")
         print(" - safety sensors checked")